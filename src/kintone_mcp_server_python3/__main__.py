@@ -3,9 +3,10 @@
 import asyncio
 import logging
 import sys
+from typing import TYPE_CHECKING
 
-from .config import KintoneConfig, KintoneConfigError
-from .server import KintoneMCPServer
+if TYPE_CHECKING:
+    from .config import KintoneConfig
 
 
 # Setup logging
@@ -15,27 +16,46 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def setup_logging(config: KintoneConfig) -> None:
-    """Setup logging based on configuration."""
-    logging.basicConfig(
-        level=getattr(logging, config.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+def setup_logging(config: "KintoneConfig") -> None:
+    """Setup logging based on configuration.
+
+    basicConfig is a no-op once handlers exist, so the configured level is
+    applied to the root logger directly.
+    """
+    logging.getLogger().setLevel(getattr(logging, config.log_level.upper()))
+
+
+def _install_uvloop() -> None:
+    """Use the uvloop event loop policy when the optional dependency exists."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
     """Main entry point."""
+    # Imported lazily so the pydantic-settings graph loads only when the
+    # server actually starts
+    from .config import KintoneConfigError, load_config
+
     try:
         # Load configuration
-        config = KintoneConfig()
+        config = load_config()
 
         # Setup logging
         setup_logging(config)
 
+        # Imported lazily so configuration errors surface before the heavy
+        # mcp/requests import graph is loaded
+        from .server import KintoneMCPServer
+
         # Create and run server
         server = KintoneMCPServer(config.to_auth_config())
 
-        # Run the async server
+        # Run the async server (under uvloop when available)
+        _install_uvloop()
         asyncio.run(server.run())
 
     except KeyboardInterrupt:
@@ -1,9 +1,8 @@
 """Authentication module for kintone API."""
 
 import base64
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .constants import (
     CONTENT_TYPE_JSON,
@@ -14,38 +13,55 @@ from .constants import (
 from .exceptions import KintoneAuthError
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Authentication configuration."""
 
     domain: str
 
 
-class KintoneAuth(ABC):
-    """Base class for kintone authentication."""
+class KintoneAuth:
+    """Base class for kintone authentication.
+
+    Subclasses must implement _build_headers(); no ABC metaclass is used so
+    instantiation and isinstance checks stay on the fast path.
+    """
+
+    __slots__ = ("config", "_headers", "_base_url")
 
     def __init__(self, config: AuthConfig):
         self.config = config
+        self._headers: Optional[Dict[str, str]] = None
+        self._base_url: Optional[str] = None
 
-    @abstractmethod
     def get_headers(self) -> Dict[str, str]:
-        """Get authentication headers."""
-        pass
+        """Get authentication headers (built once and cached)."""
+        if self._headers is None:
+            self._headers = self._build_headers()
+        return self._headers
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the authentication headers."""
+        raise NotImplementedError
 
     def get_base_url(self) -> str:
-        """Get the base URL for kintone API."""
-        return f"https://{self.config.domain}"
+        """Get the base URL for kintone API (built once and cached)."""
+        if self._base_url is None:
+            self._base_url = f"https://{self.config.domain}"
+        return self._base_url
 
 
 class APITokenAuth(KintoneAuth):
     """API Token authentication."""
 
+    __slots__ = ("api_token",)
+
     def __init__(self, config: AuthConfig, api_token: str):
         super().__init__(config)
         self.api_token = api_token
 
-    def get_headers(self) -> Dict[str, str]:
-        """Get API Token authentication headers."""
+    def _build_headers(self) -> Dict[str, str]:
+        """Build API Token authentication headers."""
         return {
             HEADER_API_TOKEN: self.api_token,
             HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON,
@@ -55,16 +71,19 @@ class APITokenAuth(KintoneAuth):
 class PasswordAuth(KintoneAuth):
     """Username/Password authentication."""
 
+    __slots__ = ("username", "password", "_encoded")
+
     def __init__(self, config: AuthConfig, username: str, password: str):
         super().__init__(config)
         self.username = username
         self.password = password
+        # Encode the credential once; it never changes for the life of the auth
+        auth_string = f"{username}:{password}"
+        self._encoded = base64.b64encode(auth_string.encode()).decode()
 
-    def get_headers(self) -> Dict[str, str]:
-        """Get Password authentication headers."""
-        auth_string = f"{self.username}:{self.password}"
-        encoded = base64.b64encode(auth_string.encode()).decode()
-        return {HEADER_AUTH: encoded, HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON}
+    def _build_headers(self) -> Dict[str, str]:
+        """Build Password authentication headers."""
+        return {HEADER_AUTH: self._encoded, HEADER_CONTENT_TYPE: CONTENT_TYPE_JSON}
 
 
 def create_auth(auth_config: Dict[str, Any]) -> KintoneAuth:
@@ -1,21 +1,34 @@
 """kintone API client."""
 
-import json
-from typing import Any, Dict, List, Optional
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, NoReturn, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from .auth import KintoneAuth
 from .constants import (
+    APP_CACHE_SIZE,
+    APP_CACHE_TTL,
+    FILE_CHUNK_SIZE,
     HEADER_METHOD_OVERRIDE,
     MAX_APPS_PER_REQUEST,
     MAX_BATCH_RECORDS,
     MAX_COMMENTS_PER_REQUEST,
+    MAX_CONCURRENT_REQUESTS,
     MAX_RECORDS_PER_REQUEST,
 )
 from .exceptions import KintoneAPIError, KintoneNetworkError, KintoneValidationError
-from .utils import parse_kintone_query
+from .utils import json_dumps_bytes, json_loads, parse_kintone_query
 from .models import (
+    CreateCursorResponse,
+    GetCursorRecordsResponse,
     GetRecordsResponse,
     GetAppsResponse,
     GetRecordResponse,
@@ -35,25 +48,141 @@ from .models import (
 )
 
 
+# One immutable override-header mapping per HTTP verb, shared by all calls
+_OVERRIDE_HEADERS = {
+    method: MappingProxyType({HEADER_METHOD_OVERRIDE: method})
+    for method in ("GET", "POST", "PUT", "DELETE")
+}
+
+
 class KintoneClient:
     """Client for kintone REST API."""
 
     def __init__(self, auth: KintoneAuth):
         self.auth = auth
         self.base_url = auth.get_base_url()
-        self.headers = auth.get_headers()
+        # Read-only view so the shared auth headers cannot be mutated
+        self.headers = MappingProxyType(auth.get_headers())
+        self.api_base = f"{self.base_url}/k/v1"
+        self._file_url = f"{self.api_base}/file.json"
+
+        # Reuse pooled sessions so TCP connections and TLS handshakes are
+        # shared across API calls. Every call goes out as POST because of
+        # the X-HTTP-Method-Override pattern, so POST must be listed in
+        # allowed_methods for either retry policy to fire. Reads
+        # (override-GET) are safe to retry on 429/5xx; writes must not be
+        # re-sent once the request may have reached the server, so their
+        # retries cover connection setup only.
+        self.session = self._build_session(
+            Retry(
+                total=3,
+                backoff_factor=0.3,
+                connect=3,
+                read=0,
+                status=0,
+                allowed_methods=frozenset({"POST"}),
+            )
+        )
+        self._read_session = self._build_session(
+            Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+            )
+        )
+
+        # TTL + LRU cache for app metadata (app info, app lists, form fields)
+        self._app_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._app_cache_lock = threading.Lock()
+
+    def _build_session(self, retry: Retry) -> requests.Session:
+        """Build a pooled session carrying the auth headers."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _cached_app_data(
+        self, key: Tuple[Any, ...], fetch: Callable[[], Any]
+    ) -> Any:
+        """Return cached app metadata, fetching on miss or expiry.
+
+        Entries expire after APP_CACHE_TTL seconds and the least recently
+        used entry is evicted once APP_CACHE_SIZE entries are held.
+        """
+        now = time.monotonic()
+        with self._app_cache_lock:
+            entry = self._app_cache.get(key)
+            if entry is not None and now - entry[0] < APP_CACHE_TTL:
+                self._app_cache.move_to_end(key)
+                return entry[1]
+
+        value = fetch()
+
+        with self._app_cache_lock:
+            self._app_cache[key] = (now, value)
+            self._app_cache.move_to_end(key)
+            while len(self._app_cache) > APP_CACHE_SIZE:
+                self._app_cache.popitem(last=False)
+
+        return value
+
+    def close(self) -> None:
+        """Close the underlying HTTP sessions and their pooled connections."""
+        self.session.close()
+        self._read_session.close()
+
+    @staticmethod
+    def _raise_api_error(response: requests.Response) -> NoReturn:
+        """Raise KintoneAPIError from an HTTP error response.
+
+        The error body is parsed exactly once; a non-JSON body falls back to
+        the raw text.
+        """
+        try:
+            error_data = json_loads(response.content)
+        except ValueError:
+            raise KintoneAPIError(f"HTTP {response.status_code}: {response.text}")
+
+        raise KintoneAPIError(
+            message=error_data.get("message", f"HTTP {response.status_code}"),
+            code=error_data.get("code"),
+            errors=error_data.get("errors"),
+            status_code=response.status_code,
+        )
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request to kintone API."""
-        url = f"{self.base_url}/k/v1{endpoint}"
+        """Make HTTP request to kintone API and decode the JSON body."""
+        result: Dict[str, Any] = json_loads(
+            self._make_request_raw(method, endpoint, **kwargs)
+        )
+        return result
+
+    def _make_request_raw(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Make HTTP request to kintone API and return the raw body.
 
-        # Merge headers
-        headers = self.headers.copy()
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        Returning bytes lets callers validate straight into Pydantic models
+        with model_validate_json, skipping the intermediate dict.
+        """
+        url = f"{self.api_base}{endpoint}"
 
-        # Use POST method with X-HTTP-Method-Override header
-        headers[HEADER_METHOD_OVERRIDE] = method
+        # Auth headers live on the session; only the method-override header
+        # travels per call, using a preallocated mapping on the common path
+        headers = kwargs.pop("headers", None)
+        if headers:
+            headers[HEADER_METHOD_OVERRIDE] = method
+        else:
+            headers = _OVERRIDE_HEADERS.get(method) or {
+                HEADER_METHOD_OVERRIDE: method
+            }
 
         # Convert params to JSON body for POST request
         # All requests to kintone API should use POST method
@@ -65,30 +194,23 @@ class KintoneClient:
                 # Merge params into existing json
                 kwargs["json"].update(kwargs.pop("params"))
 
+        # Encode the body ourselves so orjson is used when available;
+        # the session's Content-Type header already declares JSON
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps_bytes(kwargs.pop("json"))
+
+        # Only override-GET reads go through the status-retrying session;
+        # replaying a write after a 5xx could duplicate it server-side
+        session = self._read_session if method == "GET" else self.session
+
         try:
-            response = requests.request(
-                method="POST", url=url, headers=headers, **kwargs
-            )
+            response = session.post(url=url, headers=headers, **kwargs)
 
             # Check for HTTP errors
             if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    raise KintoneAPIError(
-                        message=error_data.get(
-                            "message", f"HTTP {response.status_code}"
-                        ),
-                        code=error_data.get("code"),
-                        errors=error_data.get("errors"),
-                        status_code=response.status_code,
-                    )
-                except (json.JSONDecodeError, KeyError):
-                    raise KintoneAPIError(
-                        f"HTTP {response.status_code}: {response.text}"
-                    )
-
-            result: Dict[str, Any] = response.json()
-            return result
+                self._raise_api_error(response)
+
+            return response.content
 
         except RequestException as e:
             raise KintoneNetworkError(f"Request failed: {str(e)}")
@@ -115,30 +237,47 @@ class KintoneClient:
         Returns:
             GetRecordsResponse containing records and optional total count
         """
-        # Parse query to extract order by, limit, and offset
-        parsed_query = parse_kintone_query(query, limit, offset)
-        
-        # Build request parameters
-        params: Dict[str, Any] = {
-            "app": app,
-            "size": min(parsed_query["limit"], MAX_RECORDS_PER_REQUEST) if parsed_query["limit"] is not None else MAX_RECORDS_PER_REQUEST,
-        }
-
-        # Build final query
-        query_parts = []
-        if parsed_query["base_query"]:
-            query_parts.append(parsed_query["base_query"])
-        if parsed_query["order_by"]:
-            query_parts.append(parsed_query["order_by"])
-        
-        # Always add limit and offset
-        query_parts.append(f"limit {params['size']}")
-        if parsed_query["offset"] is not None:
-            query_parts.append(f"offset {parsed_query['offset']}")
+        if not query:
+            # Fast path: nothing to parse or reassemble without a query
+            size = (
+                min(limit, MAX_RECORDS_PER_REQUEST)
+                if limit is not None
+                else MAX_RECORDS_PER_REQUEST
+            )
+            params: Dict[str, Any] = {
+                "app": app,
+                "size": size,
+                "query": f"limit {size} offset {offset if offset is not None else 0}",
+            }
         else:
-            query_parts.append("offset 0")
-        
-        params["query"] = " ".join(query_parts)
+            # Parse query to extract order by, limit, and offset
+            parsed_query = parse_kintone_query(query, limit, offset)
+
+            # Build request parameters
+            params = {
+                "app": app,
+                "size": (
+                    min(parsed_query["limit"], MAX_RECORDS_PER_REQUEST)
+                    if parsed_query["limit"] is not None
+                    else MAX_RECORDS_PER_REQUEST
+                ),
+            }
+
+            # Build final query
+            query_parts = []
+            if parsed_query["base_query"]:
+                query_parts.append(parsed_query["base_query"])
+            if parsed_query["order_by"]:
+                query_parts.append(parsed_query["order_by"])
+
+            # Always add limit and offset
+            query_parts.append(f"limit {params['size']}")
+            if parsed_query["offset"] is not None:
+                query_parts.append(f"offset {parsed_query['offset']}")
+            else:
+                query_parts.append("offset 0")
+
+            params["query"] = " ".join(query_parts)
 
         if fields:
             params["fields"] = fields
@@ -147,11 +286,11 @@ class KintoneClient:
             params["totalCount"] = total_count
 
         # Make request
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="GET", endpoint="/records.json", params=params
         )
 
-        return GetRecordsResponse(**response_data)
+        return GetRecordsResponse.model_validate_json(response_data)
 
     def get_all_records(
         self,
@@ -171,27 +310,134 @@ class KintoneClient:
         Returns:
             List of all records matching the query
         """
-        all_records = []
-        offset = 0
+        all_records: List[Dict[str, Any]] = []
+        for batch in self.iter_all_records(
+            app=app, query=query, fields=fields, batch_size=batch_size
+        ):
+            all_records.extend(batch)
+        return all_records
 
-        while True:
-            response = self.get_records(
-                app=app, query=query, fields=fields, limit=batch_size, offset=offset
-            )
+    def iter_all_records(
+        self,
+        app: int,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over all records of a kintone app, one batch at a time.
 
-            records = response.records
-            if not records:
-                break
+        Only one batch is held in memory at once, so callers can process
+        arbitrarily large apps with bounded memory. Abandoning the iterator
+        early deletes the server-side cursor.
 
-            all_records.extend(records)
+        Args:
+            app: The app ID
+            query: Query string to filter records
+            fields: List of field codes to retrieve
+            batch_size: Number of records per batch (max 500)
 
-            # Check if we've retrieved all records
-            if len(records) < batch_size:
-                break
+        Yields:
+            Lists of records, up to batch_size each
+        """
+        # A cursor streams records sequentially on the server side, avoiding
+        # the O(N^2) offset re-scans and the 10,000-record offset ceiling
+        parsed_query = parse_kintone_query(query)
 
-            offset += batch_size
+        query_parts = []
+        if parsed_query["base_query"]:
+            query_parts.append(parsed_query["base_query"])
+        if parsed_query["order_by"]:
+            query_parts.append(parsed_query["order_by"])
 
-        return all_records
+        cursor = self.create_cursor(
+            app=app,
+            fields=fields,
+            query=" ".join(query_parts) if query_parts else None,
+            size=min(batch_size, MAX_RECORDS_PER_REQUEST),
+        )
+
+        exhausted = False
+        try:
+            # Pipeline the reads: the next batch is requested before the
+            # current one is yielded, overlapping network and consumer work
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(self.get_cursor_records, cursor.id)
+                while True:
+                    response = future.result()
+                    if response.next:
+                        future = executor.submit(
+                            self.get_cursor_records, cursor.id
+                        )
+                    else:
+                        exhausted = True
+                    yield response.records
+                    if exhausted:
+                        break
+        finally:
+            # kintone deletes the cursor automatically once it is exhausted;
+            # clean up explicitly only when we stop early
+            if not exhausted:
+                self.delete_cursor(cursor.id)
+
+    def create_cursor(
+        self,
+        app: int,
+        fields: Optional[List[str]] = None,
+        query: Optional[str] = None,
+        size: int = MAX_RECORDS_PER_REQUEST,
+    ) -> CreateCursorResponse:
+        """Create a cursor for retrieving records.
+
+        Args:
+            app: The app ID
+            fields: List of field codes to retrieve
+            query: Query string to filter records (without limit/offset)
+            size: Number of records per cursor read (max 500)
+
+        Returns:
+            CreateCursorResponse containing the cursor ID and total count
+        """
+        params: Dict[str, Any] = {
+            "app": app,
+            "size": min(size, MAX_RECORDS_PER_REQUEST),
+        }
+
+        if fields:
+            params["fields"] = fields
+
+        if query:
+            params["query"] = query
+
+        response_data = self._make_request_raw(
+            method="POST", endpoint="/records/cursor.json", json=params
+        )
+
+        return CreateCursorResponse.model_validate_json(response_data)
+
+    def get_cursor_records(self, cursor_id: str) -> GetCursorRecordsResponse:
+        """Get the next batch of records from a cursor.
+
+        Args:
+            cursor_id: The cursor ID
+
+        Returns:
+            GetCursorRecordsResponse containing records and the next flag
+        """
+        response_data = self._make_request_raw(
+            method="GET", endpoint="/records/cursor.json", params={"id": cursor_id}
+        )
+
+        return GetCursorRecordsResponse.model_validate_json(response_data)
+
+    def delete_cursor(self, cursor_id: str) -> None:
+        """Delete a cursor.
+
+        Args:
+            cursor_id: The cursor ID
+        """
+        self._make_request(
+            method="DELETE", endpoint="/records/cursor.json", json={"id": cursor_id}
+        )
 
     def get_apps(
         self,
@@ -215,30 +461,37 @@ class KintoneClient:
         Returns:
             GetAppsResponse containing list of apps
         """
-        # Build request parameters
-        params: Dict[str, Any] = {}
-
-        if name:
-            params["name"] = name
-
-        if ids:
-            params["ids"] = ids
-
-        if codes:
-            params["codes"] = codes
-
-        if space_ids:
-            params["spaceIds"] = space_ids
-
+        # Build request parameters in one pass, dropping unset filters
+        optional_params = {
+            "name": name,
+            "ids": ids,
+            "codes": codes,
+            "spaceIds": space_ids,
+        }
+        params: Dict[str, Any] = {
+            key: value for key, value in optional_params.items() if value
+        }
         params["limit"] = min(limit, MAX_APPS_PER_REQUEST)
         params["offset"] = offset
 
-        # Make request
-        response_data = self._make_request(
-            method="GET", endpoint="/apps.json", params=params
+        cache_key = (
+            "apps",
+            name,
+            tuple(ids) if ids else None,
+            tuple(codes) if codes else None,
+            tuple(space_ids) if space_ids else None,
+            params["limit"],
+            offset,
         )
 
-        return GetAppsResponse(**response_data)
+        def fetch() -> GetAppsResponse:
+            response_data = self._make_request_raw(
+                method="GET", endpoint="/apps.json", params=params
+            )
+            return GetAppsResponse.model_validate_json(response_data)
+
+        result: GetAppsResponse = self._cached_app_data(cache_key, fetch)
+        return result
 
     def get_record(self, app: int, id: int) -> GetRecordResponse:
         """Get a single record from a kintone app.
@@ -252,11 +505,11 @@ class KintoneClient:
         """
         params = {"app": app, "id": id}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="GET", endpoint="/record.json", params=params
         )
 
-        return GetRecordResponse(**response_data)
+        return GetRecordResponse.model_validate_json(response_data)
 
     def add_record(
         self, app: int, record: Dict[str, Dict[str, Any]]
@@ -272,36 +525,59 @@ class KintoneClient:
         """
         request_data = {"app": app, "record": record}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="POST", endpoint="/record.json", json=request_data
         )
 
-        return AddRecordResponse(**response_data)
+        return AddRecordResponse.model_validate_json(response_data)
 
     def add_records(
         self, app: int, records: List[Dict[str, Dict[str, Any]]]
     ) -> AddRecordsResponse:
         """Add multiple records to a kintone app.
 
+        Lists longer than the 100-record API cap are split into batches that
+        are submitted concurrently. Note that batches beyond the first are
+        not atomic with each other.
+
         Args:
             app: The app ID
-            records: List of record data (max 100 records)
+            records: List of record data
 
         Returns:
             AddRecordsResponse containing the new record IDs and revisions
         """
-        if len(records) > MAX_BATCH_RECORDS:
-            raise KintoneValidationError(
-                f"Cannot add more than {MAX_BATCH_RECORDS} records at once"
+        if len(records) <= MAX_BATCH_RECORDS:
+            return self._add_records_batch(app, records)
+
+        batches = [
+            records[i : i + MAX_BATCH_RECORDS]
+            for i in range(0, len(records), MAX_BATCH_RECORDS)
+        ]
+
+        ids: List[str] = []
+        revisions: List[str] = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            responses = executor.map(
+                lambda batch: self._add_records_batch(app, batch), batches
             )
+            for response in responses:
+                ids.extend(response.ids)
+                revisions.extend(response.revisions)
 
+        return AddRecordsResponse(ids=ids, revisions=revisions)
+
+    def _add_records_batch(
+        self, app: int, records: List[Dict[str, Dict[str, Any]]]
+    ) -> AddRecordsResponse:
+        """Add a single batch of records (max 100)."""
         request_data = {"app": app, "records": records}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="POST", endpoint="/records.json", json=request_data
         )
 
-        return AddRecordsResponse(**response_data)
+        return AddRecordsResponse.model_validate_json(response_data)
 
     def update_record(
         self,
@@ -337,49 +613,68 @@ class KintoneClient:
         if revision is not None:
             request_data["revision"] = revision
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="PUT", endpoint="/record.json", json=request_data
         )
 
-        return UpdateRecordResponse(**response_data)
+        return UpdateRecordResponse.model_validate_json(response_data)
 
     def update_records(
         self, app: int, records: List[UpdateRecordData]
     ) -> UpdateRecordsResponse:
         """Update multiple records in a kintone app.
 
+        Lists longer than the 100-record API cap are split into batches that
+        are submitted concurrently. Note that batches beyond the first are
+        not atomic with each other.
+
         Args:
             app: The app ID
-            records: List of update data (max 100 records)
+            records: List of update data
 
         Returns:
             UpdateRecordsResponse containing the updated record IDs and revisions
         """
         if len(records) > MAX_BATCH_RECORDS:
-            raise KintoneValidationError(
-                f"Cannot update more than {MAX_BATCH_RECORDS} records at once"
-            )
-
-        # Convert UpdateRecordData objects to dicts
-        records_data = []
-        for record in records:
-            record_dict: Dict[str, Any] = {}
-            if record.id is not None:
-                record_dict["id"] = record.id
-            if record.updateKey is not None:
-                record_dict["updateKey"] = record.updateKey
-            if record.revision is not None:
-                record_dict["revision"] = record.revision
-            record_dict["record"] = record.record
-            records_data.append(record_dict)
+            batches = [
+                records[i : i + MAX_BATCH_RECORDS]
+                for i in range(0, len(records), MAX_BATCH_RECORDS)
+            ]
+
+            updated: List[Dict[str, str]] = []
+            with ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_REQUESTS
+            ) as executor:
+                responses = executor.map(
+                    lambda batch: self.update_records(app, batch), batches
+                )
+                for response in responses:
+                    updated.extend(response.records)
+
+            return UpdateRecordsResponse(records=updated)
+
+        # Convert UpdateRecordData objects to dicts, dropping unset keys
+        records_data = [
+            {
+                key: value
+                for key, value in (
+                    ("id", record.id),
+                    ("updateKey", record.updateKey),
+                    ("revision", record.revision),
+                    ("record", record.record),
+                )
+                if value is not None
+            }
+            for record in records
+        ]
 
         request_data = {"app": app, "records": records_data}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="PUT", endpoint="/records.json", json=request_data
         )
 
-        return UpdateRecordsResponse(**response_data)
+        return UpdateRecordsResponse.model_validate_json(response_data)
 
     def get_comments(
         self,
@@ -409,11 +704,11 @@ class KintoneClient:
             "limit": min(limit, MAX_COMMENTS_PER_REQUEST),
         }
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="GET", endpoint="/record/comments.json", params=params
         )
 
-        return GetCommentsResponse(**response_data)
+        return GetCommentsResponse.model_validate_json(response_data)
 
     def add_comment(
         self, app: int, record: int, comment: CommentContent
@@ -434,11 +729,11 @@ class KintoneClient:
             "comment": comment.model_dump(exclude_none=True),
         }
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="POST", endpoint="/record/comment.json", json=request_data
         )
 
-        return AddCommentResponse(**response_data)
+        return AddCommentResponse.model_validate_json(response_data)
 
     def update_status(
         self,
@@ -468,36 +763,57 @@ class KintoneClient:
         if revision is not None:
             request_data["revision"] = revision
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="PUT", endpoint="/record/status.json", json=request_data
         )
 
-        return UpdateStatusResponse(**response_data)
+        return UpdateStatusResponse.model_validate_json(response_data)
 
     def update_statuses(
         self, app: int, records: List[Dict[str, Any]]
     ) -> UpdateStatusesResponse:
         """Update the status of multiple records.
 
+        Lists longer than the 100-record API cap are split into batches that
+        are submitted concurrently. Note that batches beyond the first are
+        not atomic with each other.
+
         Args:
             app: The app ID
-            records: List of status update data (max 100 records)
+            records: List of status update data
 
         Returns:
             UpdateStatusesResponse containing the updated record IDs and revisions
         """
-        if len(records) > MAX_BATCH_RECORDS:
-            raise KintoneValidationError(
-                f"Cannot update more than {MAX_BATCH_RECORDS} record statuses at once"
+        if len(records) <= MAX_BATCH_RECORDS:
+            return self._update_statuses_batch(app, records)
+
+        batches = [
+            records[i : i + MAX_BATCH_RECORDS]
+            for i in range(0, len(records), MAX_BATCH_RECORDS)
+        ]
+
+        updated: List[Dict[str, str]] = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            responses = executor.map(
+                lambda batch: self._update_statuses_batch(app, batch), batches
             )
+            for response in responses:
+                updated.extend(response.records)
 
+        return UpdateStatusesResponse(records=updated)
+
+    def _update_statuses_batch(
+        self, app: int, records: List[Dict[str, Any]]
+    ) -> UpdateStatusesResponse:
+        """Update a single batch of record statuses (max 100)."""
         request_data = {"app": app, "records": records}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="PUT", endpoint="/records/status.json", json=request_data
         )
 
-        return UpdateStatusesResponse(**response_data)
+        return UpdateStatusesResponse.model_validate_json(response_data)
 
     def upload_file(self, file_path: str) -> FileUploadResponse:
         """Upload a file to kintone.
@@ -512,11 +828,11 @@ class KintoneClient:
             files = {"file": f}
 
             # Don't use json parameter for file uploads
-            response_data = self._make_request(
+            response_data = self._make_request_raw(
                 method="POST", endpoint="/file.json", files=files
             )
 
-        return FileUploadResponse(**response_data)
+        return FileUploadResponse.model_validate_json(response_data)
 
     def upload_file_from_bytes(
         self, file_name: str, file_data: bytes
@@ -532,11 +848,11 @@ class KintoneClient:
         """
         files = {"file": (file_name, file_data)}
 
-        response_data = self._make_request(
+        response_data = self._make_request_raw(
             method="POST", endpoint="/file.json", files=files
         )
 
-        return FileUploadResponse(**response_data)
+        return FileUploadResponse.model_validate_json(response_data)
 
     def download_file(self, file_key: str) -> bytes:
         """Download a file from kintone.
@@ -549,34 +865,61 @@ class KintoneClient:
         """
         params = {"fileKey": file_key}
 
-        url = f"{self.base_url}/k/v1/file.json"
-        headers = self.headers.copy()
-        headers[HEADER_METHOD_OVERRIDE] = "GET"
+        headers = _OVERRIDE_HEADERS["GET"]
 
         try:
-            response = requests.post(url=url, headers=headers, json=params)
+            response = self._read_session.post(
+                url=self._file_url, headers=headers, json=params
+            )
 
             if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    raise KintoneAPIError(
-                        message=error_data.get(
-                            "message", f"HTTP {response.status_code}"
-                        ),
-                        code=error_data.get("code"),
-                        errors=error_data.get("errors"),
-                        status_code=response.status_code,
-                    )
-                except (json.JSONDecodeError, KeyError):
-                    raise KintoneAPIError(
-                        f"HTTP {response.status_code}: {response.text}"
-                    )
+                self._raise_api_error(response)
 
             return response.content
 
         except RequestException as e:
             raise KintoneNetworkError(f"Request failed: {str(e)}")
 
+    def download_file_to_path(
+        self, file_key: str, save_path: str, chunk_size: int = FILE_CHUNK_SIZE
+    ) -> int:
+        """Download a file from kintone directly to disk.
+
+        Streams the response body in chunks instead of buffering the whole
+        file in memory.
+
+        Args:
+            file_key: The file key
+            save_path: Path where to save the file
+            chunk_size: Size of each streamed chunk in bytes
+
+        Returns:
+            Number of bytes written
+        """
+        headers = _OVERRIDE_HEADERS["GET"]
+
+        try:
+            with self._read_session.post(
+                url=self._file_url,
+                headers=headers,
+                json={"fileKey": file_key},
+                stream=True,
+            ) as response:
+                if response.status_code >= 400:
+                    self._raise_api_error(response)
+
+                with open(save_path, "wb") as f:
+                    # copyfileobj moves data in C-level read/write cycles;
+                    # decode_content keeps transparent decompression working
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, length=chunk_size)
+                    size = f.tell()
+
+                return size
+
+        except RequestException as e:
+            raise KintoneNetworkError(f"Request failed: {str(e)}")
+
     def get_app(self, id: int) -> GetAppResponse:
         """Get app information.
 
@@ -588,11 +931,14 @@ class KintoneClient:
         """
         params = {"id": id}
 
-        response_data = self._make_request(
-            method="GET", endpoint="/app.json", params=params
-        )
+        def fetch() -> GetAppResponse:
+            response_data = self._make_request_raw(
+                method="GET", endpoint="/app.json", params=params
+            )
+            return GetAppResponse.model_validate_json(response_data)
 
-        return GetAppResponse(**response_data)
+        result: GetAppResponse = self._cached_app_data(("app", id), fetch)
+        return result
 
     def get_form_fields(
         self, app: int, lang: Optional[str] = None
@@ -611,8 +957,13 @@ class KintoneClient:
         if lang is not None:
             params["lang"] = lang
 
-        response_data = self._make_request(
-            method="GET", endpoint="/app/form/fields.json", params=params
-        )
+        def fetch() -> GetFormFieldsResponse:
+            response_data = self._make_request_raw(
+                method="GET", endpoint="/app/form/fields.json", params=params
+            )
+            return GetFormFieldsResponse.model_validate_json(response_data)
 
-        return GetFormFieldsResponse(**response_data)
+        result: GetFormFieldsResponse = self._cached_app_data(
+            ("form_fields", app, lang), fetch
+        )
+        return result
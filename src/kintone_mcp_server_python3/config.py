@@ -1,8 +1,10 @@
 """Configuration management for kintone MCP server."""
 
+import os
+from functools import cache
 from typing import Optional
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .constants import AUTH_TYPE_API_TOKEN, AUTH_TYPE_PASSWORD
 from .exceptions import KintoneConfigError
@@ -30,12 +32,14 @@ class KintoneConfig(BaseSettings):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retries")
 
-    class Config:
-        env_prefix = "KINTONE_"
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_prefix="KINTONE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
 
-    @validator("domain")
+    @field_validator("domain")
+    @classmethod
     def validate_domain(cls, v: str) -> str:
         """Validate domain format."""
         if not v or not v.strip():
@@ -49,8 +53,9 @@ class KintoneConfig(BaseSettings):
             v = v.rstrip("/")
         return v
 
-    @validator("api_token")
-    def validate_api_token(cls, v: Optional[str], values: dict) -> Optional[str]:
+    @field_validator("api_token")
+    @classmethod
+    def validate_api_token(cls, v: Optional[str]) -> Optional[str]:
         """Validate API token format."""
         # API token can contain up to 9 comma-separated tokens
         if v and v.strip():
@@ -58,26 +63,21 @@ class KintoneConfig(BaseSettings):
             return v.strip()
         return v
 
-    @validator("password")
-    def validate_auth_credentials(cls, v: Optional[str], values: dict) -> Optional[str]:
+    @model_validator(mode="after")
+    def validate_auth_credentials(self) -> "KintoneConfig":
         """Validate authentication credentials."""
-        username = values.get("username")
-        api_token = values.get("api_token")
-        
         # If both username and password are provided, use password auth
         # If neither username/password nor api_token is provided, raise error
-        if not username and not v and not api_token:
+        if not self.username and not self.password and not self.api_token:
             raise ValueError(
                 "Either username and password, or api_token must be provided"
             )
-        
+
         # If username is provided but password is missing
-        if username and not v:
-            raise ValueError(
-                "Password is required when username is provided"
-            )
-        
-        return v
+        if self.username and not self.password:
+            raise ValueError("Password is required when username is provided")
+
+        return self
 
     def get_auth_type(self) -> str:
         """Determine authentication type based on provided credentials."""
@@ -113,9 +113,23 @@ class KintoneConfig(BaseSettings):
         return config
 
 
+# Values of KINTONE_SKIP_DOTENV that enable the skip
+_SKIP_DOTENV_VALUES = frozenset({"1", "true", "yes"})
+
+
+@cache
 def load_config() -> KintoneConfig:
-    """Load configuration from environment variables and .env file."""
+    """Load configuration from environment variables and .env file.
+
+    The parsed configuration is cached: the environment is read and
+    validated once per process, and later calls return the same instance.
+    Setting KINTONE_SKIP_DOTENV=1 (or true/yes) skips the .env file
+    lookup for deployments that configure everything through the
+    environment; any setting may still come from .env otherwise.
+    """
     try:
+        if os.environ.get("KINTONE_SKIP_DOTENV", "").lower() in _SKIP_DOTENV_VALUES:
+            return KintoneConfig(_env_file=None)
         return KintoneConfig()
     except Exception as e:
         raise KintoneConfigError(f"Failed to load configuration: {str(e)}")
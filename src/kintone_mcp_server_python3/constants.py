@@ -22,8 +22,16 @@ FILE_UPLOAD_TIMEOUT = 300
 MAX_REQUESTS_PER_MINUTE = 100
 RATE_LIMIT_WINDOW = 60  # seconds
 
+# Concurrency
+MAX_CONCURRENT_REQUESTS = 5
+
+# App metadata cache
+APP_CACHE_TTL = 60  # seconds
+APP_CACHE_SIZE = 128  # entries
+
 # File paths
 TEMP_FILE_PREFIX = "kintone_temp_"
+FILE_CHUNK_SIZE = 1024 * 64  # 64KB per streamed chunk
 
 # Auth types
 AUTH_TYPE_API_TOKEN = "api_token"
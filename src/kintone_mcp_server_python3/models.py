@@ -86,6 +86,20 @@ class GetAppsResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class CreateCursorResponse(BaseModel):
+    """Response from create cursor API."""
+
+    id: str
+    totalCount: str
+
+
+class GetCursorRecordsResponse(BaseModel):
+    """Response from get cursor records API."""
+
+    records: List[Dict[str, Any]]
+    next: bool
+
+
 # Single record models
 class GetRecordRequest(BaseModel):
     """Request for getting a single record."""
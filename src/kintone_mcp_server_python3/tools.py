@@ -1,9 +1,11 @@
 """Tool definitions for kintone MCP server."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-# Tool definitions registry
-TOOLS = {
+# Tool definitions registry; frozen so consumers can share the reference
+# without defensive copies
+TOOLS: Mapping[str, Any] = MappingProxyType({
     "get_records": {
         "description": "Get records from a kintone app",
         "handler": "_get_records",
@@ -116,7 +118,7 @@ TOOLS = {
         },
     },
     "add_records": {
-        "description": "Add multiple records to a kintone app (max 100 records)",
+        "description": "Add multiple records to a kintone app (lists longer than 100 records are split into concurrent batches; batches beyond the first are not atomic with each other)",
         "handler": "_add_records",
         "schema": {
             "type": "object",
@@ -125,7 +127,7 @@ TOOLS = {
                 "records": {
                     "type": "array",
                     "items": {"type": "object"},
-                    "description": "Array of record data (max 100)",
+                    "description": "Array of record data (automatically split into 100-record batches)",
                 },
             },
             "required": ["app", "records"],
@@ -159,7 +161,7 @@ TOOLS = {
         },
     },
     "update_records": {
-        "description": "Update multiple records in a kintone app (max 100 records)",
+        "description": "Update multiple records in a kintone app (lists longer than 100 records are split into concurrent batches; batches beyond the first are not atomic with each other)",
         "handler": "_update_records",
         "schema": {
             "type": "object",
@@ -176,7 +178,7 @@ TOOLS = {
                             "record": {"type": "object"},
                         },
                     },
-                    "description": "Array of update data (max 100)",
+                    "description": "Array of update data (automatically split into 100-record batches)",
                 },
             },
             "required": ["app", "records"],
@@ -256,7 +258,7 @@ TOOLS = {
         },
     },
     "update_statuses": {
-        "description": "Update the status of multiple records (max 100)",
+        "description": "Update the status of multiple records (lists longer than 100 records are split into concurrent batches; batches beyond the first are not atomic with each other)",
         "handler": "_update_statuses",
         "schema": {
             "type": "object",
@@ -343,9 +345,9 @@ TOOLS = {
             "properties": {},
         },
     },
-}
+})
 
 
-def get_tool_definitions() -> Dict[str, Any]:
+def get_tool_definitions() -> Mapping[str, Any]:
     """Get all tool definitions."""
     return TOOLS
@@ -1,9 +1,70 @@
 """Utility functions for kintone MCP server."""
 
+import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
-from .exceptions import KintoneValidationError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from .exceptions import (
+    KintoneAPIError,
+    KintoneAuthError,
+    KintoneConfigError,
+    KintoneError,
+    KintoneNetworkError,
+    KintoneRateLimitError,
+    KintoneValidationError,
+)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON using orjson when available.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes using orjson when available.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes (non-ASCII characters are not escaped)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON using orjson when available.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as str (non-ASCII characters are not escaped)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
 
 
 def validate_file_path(path: str, must_exist: bool = False) -> Path:
@@ -19,31 +80,36 @@ def validate_file_path(path: str, must_exist: bool = False) -> Path:
     Raises:
         KintoneValidationError: If path is invalid
     """
-    try:
-        p = Path(path)
+    # os.path primitives avoid allocating a PurePath for the checks;
+    # the Path object is built once, after the path is known good
+    if ".." in path.split(os.sep):
+        raise KintoneValidationError("Path traversal not allowed")
+
+    # Ensure absolute path
+    if not os.path.isabs(path):
+        raise KintoneValidationError("Must use absolute paths")
 
-        # Check for path traversal attempts
-        if ".." in p.parts:
-            raise KintoneValidationError("Path traversal not allowed")
+    # Check existence if required
+    if must_exist and not os.path.exists(path):
+        raise KintoneValidationError(f"File not found: {path}")
 
-        # Ensure absolute path
-        if not p.is_absolute():
-            raise KintoneValidationError("Must use absolute paths")
+    return Path(path)
 
-        # Check existence if required
-        if must_exist and not p.exists():
-            raise KintoneValidationError(f"File not found: {path}")
 
-        return p
-    except Exception as e:
-        if isinstance(e, KintoneValidationError):
-            raise
-        raise KintoneValidationError(f"Invalid file path: {str(e)}")
+@lru_cache(maxsize=1024)
+def _validate_positive_int(value: Any, label: str) -> int:
+    """Coerce a value to a positive integer, memoizing successful results."""
+    value = int(value)
+    if value <= 0:
+        raise ValueError(f"{label} must be positive")
+    return value
 
 
 def validate_app_id(app_id: Any) -> int:
     """Validate app ID.
 
+    Repeated calls with the same ID hit an LRU cache.
+
     Args:
         app_id: App ID to validate
 
@@ -53,11 +119,12 @@ def validate_app_id(app_id: Any) -> int:
     Raises:
         KintoneValidationError: If app ID is invalid
     """
-    try:
-        app_id = int(app_id)
-        if app_id <= 0:
-            raise ValueError("App ID must be positive")
+    # Fast path: an exact int (bool is excluded by the type check) skips
+    # the coercion and cache machinery entirely
+    if type(app_id) is int and app_id > 0:
         return app_id
+    try:
+        return _validate_positive_int(app_id, "App ID")
     except (TypeError, ValueError) as e:
         raise KintoneValidationError(f"Invalid app ID: {str(e)}")
 
@@ -65,6 +132,8 @@ def validate_app_id(app_id: Any) -> int:
 def validate_record_id(record_id: Any) -> int:
     """Validate record ID.
 
+    Repeated calls with the same ID hit an LRU cache.
+
     Args:
         record_id: Record ID to validate
 
@@ -74,18 +143,32 @@ def validate_record_id(record_id: Any) -> int:
     Raises:
         KintoneValidationError: If record ID is invalid
     """
-    try:
-        record_id = int(record_id)
-        if record_id <= 0:
-            raise ValueError("Record ID must be positive")
+    # Fast path: an exact int (bool is excluded by the type check) skips
+    # the coercion and cache machinery entirely
+    if type(record_id) is int and record_id > 0:
         return record_id
+    try:
+        return _validate_positive_int(record_id, "Record ID")
     except (TypeError, ValueError) as e:
         raise KintoneValidationError(f"Invalid record ID: {str(e)}")
 
 
+@lru_cache(maxsize=1024)
+def _validate_limit(limit: Any, max_limit: int) -> int:
+    """Validate a limit against its maximum, memoizing successful results."""
+    limit = int(limit)
+    if limit <= 0:
+        raise ValueError("Limit must be positive")
+    if limit > max_limit:
+        raise ValueError(f"Limit exceeds maximum of {max_limit}")
+    return limit
+
+
 def validate_limit(limit: Any, max_limit: int) -> int:
     """Validate limit parameter.
 
+    Repeated calls with the same values hit an LRU cache.
+
     Args:
         limit: Limit value to validate
         max_limit: Maximum allowed limit
@@ -96,17 +179,23 @@ def validate_limit(limit: Any, max_limit: int) -> int:
     Raises:
         KintoneValidationError: If limit is invalid
     """
-    try:
-        limit = int(limit)
-        if limit <= 0:
-            raise ValueError("Limit must be positive")
-        if limit > max_limit:
-            raise ValueError(f"Limit exceeds maximum of {max_limit}")
+    # Fast path: an exact in-range int skips the coercion and cache machinery
+    if type(limit) is int and 0 < limit <= max_limit:
         return limit
+    try:
+        return _validate_limit(limit, max_limit)
     except (TypeError, ValueError) as e:
         raise KintoneValidationError(f"Invalid limit: {str(e)}")
 
 
+# Substrings stripped from queries; combined into one alternation so
+# sanitize_query scans the string in a single pass
+DANGEROUS_QUERY_SUBSTRINGS = (";", "--", "/*", "*/", "xp_", "sp_")
+_DANGEROUS_QUERY_PATTERN = re.compile(
+    "|".join(re.escape(s) for s in DANGEROUS_QUERY_SUBSTRINGS)
+)
+
+
 def sanitize_query(query: Optional[str]) -> Optional[str]:
     """Sanitize query string to prevent injection.
 
@@ -119,30 +208,50 @@ def sanitize_query(query: Optional[str]) -> Optional[str]:
     if not query:
         return None
 
-    # Basic sanitization - remove dangerous characters
-    # This is a simple implementation; consider using a proper query parser
-    dangerous_chars = [";", "--", "/*", "*/", "xp_", "sp_"]
+    # Basic sanitization - remove dangerous substrings with a compiled
+    # pattern, repeating until a pass removes nothing so that substrings
+    # spliced together by an earlier removal (e.g. "-;-" -> "--") cannot
+    # survive. This is a simple implementation; consider using a proper
+    # query parser
     sanitized = query
-
-    for char in dangerous_chars:
-        if char in sanitized:
-            sanitized = sanitized.replace(char, "")
+    while _DANGEROUS_QUERY_PATTERN.search(sanitized):
+        sanitized = _DANGEROUS_QUERY_PATTERN.sub("", sanitized)
 
     return sanitized.strip()
 
 
+# Combined pattern for the reserved trailing clauses of the kintone query
+# language, compiled once at import time; one finditer pass finds order by,
+# limit, and offset together (all case insensitive). Each clause is anchored
+# at the start of the string or after whitespace, so clause-only queries
+# (the input is stripped before matching) parse the same as trailing ones.
+# The order-by field tokens exclude commas and use possessive quantifiers so
+# the engine never backtracks into a matched token, keeping worst-case match
+# time linear
+_QUERY_CLAUSE_PATTERN = re.compile(
+    r'(?P<order>(?:^|\s++)order\s+by\s+[^\s,]++(?:\s+(?:asc|desc))?+'
+    r'(?:\s*+,\s*+[^\s,]++(?:\s+(?:asc|desc))?+)*+)'
+    r'|(?P<limit>(?:^|\s++)limit\s+(?P<limit_value>\d+))'
+    r'|(?P<offset>(?:^|\s++)offset\s+(?P<offset_value>\d+))',
+    re.IGNORECASE,
+)
+
+
 def parse_kintone_query(
-    query: Optional[str], 
+    query: Optional[str],
     default_limit: Optional[int] = None,
     default_offset: Optional[int] = None
 ) -> Dict[str, Any]:
     """Parse kintone query to extract order by, limit, and offset clauses.
-    
+
+    Parsing is pure with respect to its inputs, so results are memoized;
+    re-parsing the same query with the same defaults skips the regex work.
+
     Args:
         query: The kintone query string
         default_limit: Default limit to use if not specified in query
         default_offset: Default offset to use if not specified in query
-        
+
     Returns:
         Dict containing:
             - base_query: Query without order by, limit, offset clauses
@@ -150,68 +259,134 @@ def parse_kintone_query(
             - limit: Limit value (from query or default)
             - offset: Offset value (from query or default)
     """
-    import re
-    
+    base_query, order_by, limit, offset = _parse_kintone_query_cached(
+        query, default_limit, default_offset
+    )
+    return {
+        "base_query": base_query,
+        "order_by": order_by,
+        "limit": limit,
+        "offset": offset
+    }
+
+
+@lru_cache(maxsize=1024)
+def _parse_kintone_query_cached(
+    query: Optional[str],
+    default_limit: Optional[int],
+    default_offset: Optional[int],
+) -> tuple:
+    """Parse a query into a (base_query, order_by, limit, offset) tuple.
+
+    The tuple result is immutable, so it is safe to share via the cache;
+    the public wrapper builds a fresh dict per call.
+    """
     if not query:
-        return {
-            "base_query": "",
-            "order_by": None,
-            "limit": default_limit,
-            "offset": default_offset
-        }
-    
-    # Pattern to match order by clause (case insensitive)
-    order_pattern = r'\s+order\s+by\s+([^\s]+(?:\s+(?:asc|desc))?(?:\s*,\s*[^\s]+(?:\s+(?:asc|desc))?)*)'
-    
-    # Pattern to match limit clause (case insensitive)
-    limit_pattern = r'\s+limit\s+(\d+)'
-    
-    # Pattern to match offset clause (case insensitive)
-    offset_pattern = r'\s+offset\s+(\d+)'
-    
-    # Extract order by clause
-    order_match = re.search(order_pattern, query, re.IGNORECASE)
-    order_by = order_match.group(0).strip() if order_match else None
-    
-    # Extract limit
-    limit_match = re.search(limit_pattern, query, re.IGNORECASE)
-    query_limit = int(limit_match.group(1)) if limit_match else None
-    
-    # Extract offset
-    offset_match = re.search(offset_pattern, query, re.IGNORECASE)
-    query_offset = int(offset_match.group(1)) if offset_match else None
-    
-    # Remove order by, limit, and offset from query
-    base_query = query
-    if order_match:
-        base_query = base_query[:order_match.start()] + base_query[order_match.end():]
-    
-    # Remove limit and offset in reverse order to maintain indices
-    for pattern in [offset_pattern, limit_pattern]:
-        match = re.search(pattern, base_query, re.IGNORECASE)
-        if match:
-            base_query = base_query[:match.start()] + base_query[match.end():]
-    
-    base_query = base_query.strip()
-    
-    # Determine final limit (use smaller value if both are specified)
-    final_limit = default_limit
-    if query_limit is not None and default_limit is not None:
-        final_limit = min(query_limit, default_limit)
-    elif query_limit is not None:
-        final_limit = query_limit
+        return ("", None, default_limit, default_offset)
+
+    # Strip surrounding whitespace once so the regex and the fast-path
+    # probe never rescan a long leading run
+    query = query.strip()
+    if not query:
+        return ("", None, default_limit, default_offset)
+
+    # Fast path: pure filter expressions contain none of the reserved
+    # keywords, so a cheap substring probe skips the regex entirely
+    lowered = query.lower()
+    if (
+        "order" not in lowered
+        and "limit" not in lowered
+        and "offset" not in lowered
+    ):
+        return (query, None, default_limit, default_offset)
+
+    # One pass over the query: collect the first order by, limit, and offset
+    # clauses along with their spans so they can be sliced out afterwards
+    order_by = None
+    query_limit = None
+    query_offset = None
+    spans = []
+    for match in _QUERY_CLAUSE_PATTERN.finditer(query):
+        if match.group("order") is not None:
+            if order_by is None:
+                order_by = match.group(0).strip()
+                spans.append(match.span())
+        elif match.group("limit") is not None:
+            if query_limit is None:
+                query_limit = int(match.group("limit_value"))
+                spans.append(match.span())
+        elif query_offset is None:
+            query_offset = int(match.group("offset_value"))
+            spans.append(match.span())
+
+    # Remove the matched clauses from the query
+    if spans:
+        pieces = []
+        prev = 0
+        for start, end in spans:
+            pieces.append(query[prev:start])
+            prev = end
+        pieces.append(query[prev:])
+        base_query = "".join(pieces).strip()
+    else:
+        base_query = query
     
+    # Determine final limit (smaller of the two when both are specified);
+    # min with a None default collapses the branch ladder into one call
+    if query_limit is None:
+        final_limit = default_limit
+    else:
+        final_limit = (
+            query_limit if default_limit is None else min(query_limit, default_limit)
+        )
+
     # Determine final offset (use query offset if specified)
     final_offset = query_offset if query_offset is not None else default_offset
     
+    return (base_query, order_by, final_limit, final_offset)
+
+
+def _format_api_error(error: KintoneAPIError) -> Dict[str, Any]:
+    """Format a kintone API error."""
+    response = {
+        "error": str(error),
+        "code": error.code,
+        "details": error.errors,
+    }
+    if error.status_code:
+        response["status_code"] = error.status_code
+    return response
+
+
+def _format_kintone_error(error: KintoneError) -> Dict[str, Any]:
+    """Format a non-API kintone error."""
     return {
-        "base_query": base_query,
-        "order_by": order_by,
-        "limit": final_limit,
-        "offset": final_offset
+        "error": str(error),
+        "details": error.details,
+    }
+
+
+def _format_generic_error(error: Exception) -> Dict[str, Any]:
+    """Format an unexpected error."""
+    return {
+        "error": str(error),
+        "type": type(error).__name__,
     }
 
 
+# Exact-type dispatch table for the known exception classes; one hash
+# lookup replaces the isinstance ladder on the hot error path
+_ERROR_FORMATTERS = {
+    KintoneAPIError: _format_api_error,
+    KintoneRateLimitError: _format_api_error,
+    KintoneError: _format_kintone_error,
+    KintoneAuthError: _format_kintone_error,
+    KintoneConfigError: _format_kintone_error,
+    KintoneNetworkError: _format_kintone_error,
+    KintoneValidationError: _format_kintone_error,
+}
+
+
 def format_error_response(error: Exception) -> Dict[str, Any]:
     """Format error for response.
 
@@ -221,24 +396,13 @@ def format_error_response(error: Exception) -> Dict[str, Any]:
     Returns:
         Formatted error dict
     """
-    from .exceptions import KintoneAPIError, KintoneError
-
-    if isinstance(error, KintoneAPIError):
-        response = {
-            "error": str(error),
-            "code": error.code,
-            "details": error.errors,
-        }
-        if error.status_code:
-            response["status_code"] = error.status_code
-        return response
-    elif isinstance(error, KintoneError):
-        return {
-            "error": str(error),
-            "details": error.details,
-        }
-    else:
-        return {
-            "error": str(error),
-            "type": type(error).__name__,
-        }
+    formatter = _ERROR_FORMATTERS.get(type(error))
+    if formatter is None:
+        # Subclasses not in the table keep the original isinstance semantics
+        if isinstance(error, KintoneAPIError):
+            formatter = _format_api_error
+        elif isinstance(error, KintoneError):
+            formatter = _format_kintone_error
+        else:
+            formatter = _format_generic_error
+    return formatter(error)
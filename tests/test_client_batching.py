@@ -0,0 +1,123 @@
+"""Test client-side cursor pagination and batch splitting with a mocked transport."""
+
+import json
+from unittest.mock import patch
+
+from kintone_mcp_server_python3.auth import create_auth
+from kintone_mcp_server_python3.client import KintoneClient
+
+
+def _make_client() -> KintoneClient:
+    """Build a client with API token auth; no request ever leaves the mock."""
+    return KintoneClient(
+        create_auth(
+            {"type": "api_token", "domain": "example.cybozu.com", "api_token": "token"}
+        )
+    )
+
+
+class TestCursorPagination:
+    """Test cursor-based record retrieval."""
+
+    def test_get_all_records_exhausts_cursor(self):
+        """An exhausted cursor returns every record and is not deleted."""
+        client = _make_client()
+        state = {"reads": 0, "deleted": False}
+
+        def fake(method, endpoint, **kwargs):
+            assert endpoint == "/records/cursor.json"
+            if method == "POST":
+                return json.dumps({"id": "cursor-1", "totalCount": "6"}).encode()
+            if method == "GET":
+                state["reads"] += 1
+                batch = [
+                    {"num": {"value": str(state["reads"] * 2 - 1)}},
+                    {"num": {"value": str(state["reads"] * 2)}},
+                ]
+                return json.dumps(
+                    {"records": batch, "next": state["reads"] < 3}
+                ).encode()
+            state["deleted"] = True
+            return b"{}"
+
+        with patch.object(client, "_make_request_raw", side_effect=fake):
+            records = client.get_all_records(app=1)
+
+        assert [r["num"]["value"] for r in records] == [str(n) for n in range(1, 7)]
+        assert state["reads"] == 3
+        # kintone drops an exhausted cursor itself; no explicit delete
+        assert state["deleted"] is False
+
+    def test_iter_all_records_early_close_deletes_cursor(self):
+        """Abandoning the iterator early deletes the server-side cursor."""
+        client = _make_client()
+        state = {"deleted": False}
+
+        def fake(method, endpoint, **kwargs):
+            assert endpoint == "/records/cursor.json"
+            if method == "POST":
+                return json.dumps({"id": "cursor-1", "totalCount": "100"}).encode()
+            if method == "GET":
+                return json.dumps(
+                    {"records": [{"num": {"value": "1"}}], "next": True}
+                ).encode()
+            assert method == "DELETE"
+            state["deleted"] = True
+            return b"{}"
+
+        with patch.object(client, "_make_request_raw", side_effect=fake):
+            iterator = client.iter_all_records(app=1)
+            first_batch = next(iterator)
+            iterator.close()
+
+        assert first_batch == [{"num": {"value": "1"}}]
+        assert state["deleted"] is True
+
+
+class TestBatchSplitting:
+    """Test splitting of record lists beyond the 100-record API cap."""
+
+    def test_add_records_splits_batches_and_preserves_order(self):
+        """250 records go out as 100+100+50 and ids come back in input order."""
+        client = _make_client()
+        batch_sizes = []
+
+        def fake(method, endpoint, **kwargs):
+            assert method == "POST"
+            assert endpoint == "/records.json"
+            batch = kwargs["json"]["records"]
+            batch_sizes.append(len(batch))
+            ids = [record["num"]["value"] for record in batch]
+            return json.dumps(
+                {"ids": ids, "revisions": ["1"] * len(ids)}
+            ).encode()
+
+        records = [{"num": {"value": str(n)}} for n in range(250)]
+        with patch.object(client, "_make_request_raw", side_effect=fake):
+            response = client.add_records(app=1, records=records)
+
+        assert sorted(batch_sizes) == [50, 100, 100]
+        assert response.ids == [str(n) for n in range(250)]
+        assert len(response.revisions) == 250
+
+    def test_update_statuses_splits_batches_and_preserves_order(self):
+        """Status updates are chunked the same way and stitched in order."""
+        client = _make_client()
+        batch_sizes = []
+
+        def fake(method, endpoint, **kwargs):
+            assert method == "PUT"
+            assert endpoint == "/records/status.json"
+            batch = kwargs["json"]["records"]
+            batch_sizes.append(len(batch))
+            results = [{"id": str(entry["id"]), "revision": "2"} for entry in batch]
+            return json.dumps({"records": results}).encode()
+
+        records = [{"id": n, "action": "Approve"} for n in range(120)]
+        with patch.object(client, "_make_request_raw", side_effect=fake):
+            response = client.update_statuses(app=1, records=records)
+
+        assert sorted(batch_sizes) == [20, 100]
+        assert [entry["id"] for entry in response.records] == [
+            str(n) for n in range(120)
+        ]